@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Long-lived Playwright browser server for the bin collection scraper.
+
+Running Chromium as a persistent server means the scraper pays the browser
+cold-start cost once instead of on every cron/systemd invocation. Point the
+scraper at the printed websocket endpoint via the PLAYWRIGHT_WS environment
+variable.
+
+playwright-python does not expose BrowserType.launch_server (it is a Node.js
+-only API), so this wraps the CLI command that ships with the package:
+
+    python -m playwright launch-server --browser chromium
+
+Intended to be run under systemd, e.g.:
+
+    [Service]
+    ExecStart=/usr/bin/python3 /app/bin_browser_daemon.py
+    Restart=always
+"""
+
+import signal
+import subprocess
+import sys
+
+
+def main():
+    """Run the Playwright launch-server CLI and relay its ws endpoint."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "playwright", "launch-server", "--browser", "chromium"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+    try:
+        # The CLI prints the websocket endpoint on stdout once the browser
+        # is up; scan for it so a future banner line doesn't break us
+        ws_endpoint = None
+        for line in process.stdout:
+            line = line.strip()
+            if "ws://" in line:
+                ws_endpoint = line[line.index("ws://"):]
+                break
+
+        if not ws_endpoint:
+            print("Error: playwright launch-server exited without printing an endpoint", file=sys.stderr)
+            sys.exit(process.wait() or 1)
+
+        print(f"Browser server listening on: {ws_endpoint}", flush=True)
+        print(f"Set PLAYWRIGHT_WS={ws_endpoint} for the scraper", file=sys.stderr, flush=True)
+
+        # Block until the browser server exits, mirroring its exit code so
+        # systemd restarts us together
+        sys.exit(process.wait())
+    finally:
+        if process.poll() is None:
+            process.send_signal(signal.SIGTERM)
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
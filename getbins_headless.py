@@ -4,19 +4,34 @@ Headless script to fetch bin collection dates from Bath & North East Somerset Co
 Uses Playwright for headless browser automation and BeautifulSoup for HTML parsing.
 """
 
+import argparse
+import asyncio
 import json
 import os
-import random
 import sys
-import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import async_playwright
+
+try:
+    import httpx
+except ImportError:
+    print("Warning: httpx not installed. HTTP fast path disabled; using browser.", file=sys.stderr)
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import psycopg2
+    import psycopg2.extras
+    import psycopg2.pool
 except ImportError:
     print("Error: psycopg2 is required. Install with: pip install psycopg2-binary")
     sys.exit(1)
@@ -43,6 +58,15 @@ if load_dotenv:
 POSTCODE = os.getenv("POSTCODE", "").strip().strip('"\'')
 ADDRESS_TEXT = os.getenv("ADDRESS_LINE", "").strip().strip('"\'')
 TIMEZONE = os.getenv("TIMEZONE", "Europe/London").strip().strip('"\'')
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# Resolve the timezone once at import - ZoneInfo construction hits the tzdata
+# files on disk, and every date helper needs the same zone
+try:
+    _TZ = ZoneInfo(TIMEZONE)
+except Exception:
+    print(f"Warning: Invalid timezone '{TIMEZONE}', using Europe/London", file=sys.stderr)
+    _TZ = ZoneInfo("Europe/London")
 
 # Database configuration from environment variables
 DB_CONFIG = {
@@ -51,17 +75,56 @@ DB_CONFIG = {
     "database": os.getenv("PG_DATABASE", "binday").strip().strip('"\''),
     "user": os.getenv("PG_USERNAME", "").strip().strip('"\''),
     "password": os.getenv("PG_PASSWORD", "").strip().strip('"\''),
-    "application_name": os.getenv("PG_APPNAME", "binday-scraper").strip().strip('"\'')
+    "application_name": os.getenv("PG_APPNAME", "binday-scraper").strip().strip('"\''),
+    # One-shot upserts of non-critical data: skip the commit fsync wait
+    "options": "-c synchronous_commit=off",
 }
 
-# Validate required environment variables
-if not POSTCODE:
-    print("Error: POSTCODE environment variable is required", file=sys.stderr)
-    sys.exit(1)
+# Addresses to scrape: either a JSON list via ADDRESSES_JSON, e.g.
+#   [{"postcode": "BA1 1AA", "address": "1 High Street, Bath"}, ...]
+# (bare [postcode, address] pairs also accepted), or the single
+# POSTCODE/ADDRESS_LINE pair
+ADDRESSES_JSON = os.getenv("ADDRESSES_JSON", "").strip()
+if ADDRESSES_JSON:
+    try:
+        _raw_addresses = json.loads(ADDRESSES_JSON)
+    except json.JSONDecodeError as e:
+        print(f"Error: ADDRESSES_JSON is not valid JSON: {e}", file=sys.stderr)
+        sys.exit(1)
 
-if not ADDRESS_TEXT:
-    print("Error: ADDRESS_LINE environment variable is required", file=sys.stderr)
-    sys.exit(1)
+    if not isinstance(_raw_addresses, list) or not _raw_addresses:
+        print("Error: ADDRESSES_JSON must be a non-empty JSON list of addresses", file=sys.stderr)
+        sys.exit(1)
+
+    ADDRESSES = []
+    for entry in _raw_addresses:
+        if isinstance(entry, dict):
+            postcode = str(entry.get("postcode", "")).strip()
+            address = str(entry.get("address", "")).strip()
+        elif isinstance(entry, (list, tuple)) and len(entry) == 2:
+            postcode = str(entry[0]).strip()
+            address = str(entry[1]).strip()
+        else:
+            print(f"Error: ADDRESSES_JSON entries must be objects with postcode/address keys "
+                  f"or [postcode, address] pairs, got: {entry!r}", file=sys.stderr)
+            sys.exit(1)
+
+        if not postcode or not address:
+            print(f"Error: ADDRESSES_JSON entry is missing a postcode or address: {entry!r}", file=sys.stderr)
+            sys.exit(1)
+
+        ADDRESSES.append((postcode, address))
+else:
+    # Validate required environment variables
+    if not POSTCODE:
+        print("Error: POSTCODE environment variable is required", file=sys.stderr)
+        sys.exit(1)
+
+    if not ADDRESS_TEXT:
+        print("Error: ADDRESS_LINE environment variable is required", file=sys.stderr)
+        sys.exit(1)
+
+    ADDRESSES = [(POSTCODE, ADDRESS_TEXT)]
 
 if not DB_CONFIG["host"]:
     print("Error: PG_HOST environment variable is required", file=sys.stderr)
@@ -76,136 +139,147 @@ if not DB_CONFIG["password"]:
     sys.exit(1)
 
 
-def random_wait():
-    """Wait for a random time between 0.5 and 2 seconds."""
-    time.sleep(random.uniform(0.5, 2.0))
+# Bin type column prefixes, in table column order
+BIN_COLUMN_PREFIXES = [
+    "black_rubbish_140l",
+    "blue_cardboard_bag",
+    "black_food_waste",
+    "green_garden_bin",
+    "green_recycling_box",
+]
+
+# Full column list for the collections table, in insert order
+COLLECTION_COLUMNS = ["address", "site_last_checked"] + [
+    f"{prefix}_{suffix}"
+    for prefix in BIN_COLUMN_PREFIXES
+    for suffix in ("last_collection", "next_collection")
+]
+
+
+# Classification rules for the collection type strings the site uses.
+# Each entry is (keyword groups, column prefix, waste group): a type matches
+# when every group has at least one keyword present in the lowercased name.
+_BIN_RULES = [
+    ((("black",), ("rubbish",)),
+     "black_rubbish_140l", "General Rubbish (black bin)"),
+    ((("blue",), ("cardboard", "bag")),
+     "blue_cardboard_bag", "Cardboard (blue bag/box)"),
+    ((("food", "caddy"),),
+     "black_food_waste", "Food Waste (caddy)"),
+    ((("green",), ("recycling",)),
+     "green_recycling_box", ["Plastics & Metals (green box)", "Glass & Paper (green box)"]),
+    ((("garden",), ("waste",)),
+     "green_garden_bin", "Garden Waste (garden bin subscription)"),
+]
+
+
+@lru_cache(maxsize=64)
+def classify_bin(collection_type):
+    """Classify a collection type string in a single pass.
+
+    Lowercases once and scans the rule table, instead of the two previous
+    classifiers each re-scanning the same string. Cached because the same
+    handful of collection type strings recurs every run.
+
+    Args:
+        collection_type: The raw collection type string from the website
+
+    Returns:
+        Tuple of (column_prefix, waste_group); both None if not recognized
+    """
+    if not collection_type:
+        return (None, None)
+
+    collection_type_lower = collection_type.lower()
+
+    for keyword_groups, column_prefix, waste_group in _BIN_RULES:
+        if all(any(k in collection_type_lower for k in group) for group in keyword_groups):
+            return (column_prefix, waste_group)
+
+    return (None, None)
 
 
 def get_waste_group(collection_type):
     """Map collection type to waste group(s).
-    
+
     Args:
         collection_type: The collection type string
-    
+
     Returns:
         String or list of strings representing the waste group(s)
     """
-    if not collection_type:
-        return None
-    
-    collection_type_lower = collection_type.lower()
-    
-    # Black Rubbish Bin
-    if "black" in collection_type_lower and "rubbish" in collection_type_lower:
-        return "General Rubbish (black bin)"
-    
-    # Blue Recycling Bag for Cardboard
-    if "blue" in collection_type_lower and ("cardboard" in collection_type_lower or "bag" in collection_type_lower):
-        return "Cardboard (blue bag/box)"
-    
-    # Food Recycling Collection Bin
-    if "food" in collection_type_lower or "caddy" in collection_type_lower:
-        return "Food Waste (caddy)"
-    
-    # Green Recycling Box
-    if "green" in collection_type_lower and "recycling" in collection_type_lower:
-        return [
-            "Plastics & Metals (green box)",
-            "Glass & Paper (green box)"
-        ]
-    
-    # Garden Waste Bin
-    if "garden" in collection_type_lower and "waste" in collection_type_lower:
-        return "Garden Waste (garden bin subscription)"
-    
-    # Default fallback
-    return None
+    return classify_bin(collection_type)[1]
+
+
+# Day names that prefix every date string on the site ("Monday, 17 November 2025")
+_DAYS = frozenset(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
 
 
 def is_date(val):
     """Check if a value looks like a date."""
-    if not val:
-        return False
-    return any(day in val for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+    # Site dates always start with "<Dayname>, ", so one partition and a set
+    # lookup replaces seven substring scans
+    return bool(val) and val.partition(',')[0].strip() in _DAYS
+
+
+@lru_cache(maxsize=64)
+def _strptime_date(date_part):
+    """Parse a date like "17 November 2025" (cached - the same handful of
+    date strings recurs across bin types every run)."""
+    return datetime.strptime(date_part, "%d %B %Y")
 
 
-def parse_collection_date(date_str):
+def parse_collection_date(date_str, tz=_TZ):
     """Parse a collection date string into a datetime object at 7am local time.
-    
+
     Args:
         date_str: Date string like "Monday, 17 November 2025"
-    
+        tz: Timezone for the resulting datetime (defaults to the configured zone)
+
     Returns:
-        datetime object at 7am in Europe/London timezone, or None if parsing fails
+        datetime object at 7am in the given timezone, or None if parsing fails
     """
     if not date_str:
         return None
-    
+
     try:
         # Parse date string (format: "Monday, 17 November 2025")
         # Remove day name and comma
         date_part = date_str.split(',', 1)[-1].strip()
-        # Parse the date
-        dt = datetime.strptime(date_part, "%d %B %Y")
-        # Set time to 7am
-        dt = dt.replace(hour=7, minute=0, second=0, microsecond=0)
-        # Set timezone to configured timezone
-        try:
-            tz = ZoneInfo(TIMEZONE)
-        except Exception:
-            tz = ZoneInfo("Europe/London")
-        dt = dt.replace(tzinfo=tz)
-        return dt
+        # Parse the date, then set time to 7am in the configured timezone
+        dt = _strptime_date(date_part)
+        return dt.replace(hour=7, minute=0, second=0, microsecond=0, tzinfo=tz)
     except (ValueError, AttributeError):
         return None
 
 
-def format_time_until_next(days, minutes):
+def format_time_until_next(total_seconds):
     """Format time until next collection as plain text.
-    
+
     Args:
-        days: Number of days
-        minutes: Total number of minutes
-    
+        total_seconds: Total number of seconds until the collection
+
     Returns:
         Plain text string like "2 days, 5 hours and 30 minutes"
     """
-    if minutes < 0:
+    if total_seconds < 0:
         return "Collection time has passed"
-    
-    # Calculate hours and remaining minutes
-    total_minutes = minutes
-    hours = total_minutes // 60
-    remaining_minutes = total_minutes % 60
-    
-    # If we have days, subtract the minutes already accounted for in days
-    if days > 0:
-        hours_in_days = days * 24
-        hours = hours - hours_in_days
-    
-    parts = []
-    
-    if days > 0:
-        if days == 1:
-            parts.append("1 day")
-        else:
-            parts.append(f"{days} days")
-    
-    if hours > 0:
-        if hours == 1:
-            parts.append("1 hour")
-        else:
-            parts.append(f"{hours} hours")
-    
-    if remaining_minutes > 0:
-        if remaining_minutes == 1:
-            parts.append("1 minute")
-        else:
-            parts.append(f"{remaining_minutes} minutes")
-    
+
+    # Split into components with a single divmod chain (the old days/minutes
+    # arithmetic double-counted and could drift when minutes were truncated)
+    days, remainder = divmod(total_seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
+
+    parts = [
+        f"1 {unit}" if value == 1 else f"{value} {unit}s"
+        for value, unit in ((days, "day"), (hours, "hour"), (minutes, "minute"))
+        if value > 0
+    ]
+
     if not parts:
         return "Less than 1 minute"
-    
+
     # Format with proper conjunctions
     if len(parts) == 1:
         return parts[0]
@@ -215,68 +289,88 @@ def format_time_until_next(days, minutes):
         return ", ".join(parts[:-1]) + f" and {parts[-1]}"
 
 
-def calculate_time_differences(next_collection_str, last_collection_str):
-    """Calculate days and minutes since last collection and until next collection.
-    
+def _calculate_diffs(next_dt, last_dt, now):
+    """Compute day/minute deltas from already-parsed collection datetimes.
+
     Args:
-        next_collection_str: Next collection date string
-        last_collection_str: Last collection date string
-    
+        next_dt: Next collection datetime, or None
+        last_dt: Last collection datetime, or None
+        now: Current time to calculate against
+
     Returns:
         Dictionary with time difference calculations
     """
     result = {}
-    
-    # Get current time in the configured timezone
-    try:
-        tz = ZoneInfo(TIMEZONE)
-    except Exception:
-        print(f"Warning: Invalid timezone '{TIMEZONE}', using Europe/London", file=sys.stderr)
-        tz = ZoneInfo("Europe/London")
-    now = datetime.now(tz)
-    
+
     # Calculate time until next collection
-    if next_collection_str:
-        next_dt = parse_collection_date(next_collection_str)
-        if next_dt:
-            if next_dt >= now:
-                # Next collection is in the future
-                delta = next_dt - now
-                days = delta.days
-                minutes = int(delta.total_seconds() / 60)
-                result["days_until_next"] = days
-                result["minutes_until_next"] = minutes
-                # Add plain text representation
-                result["time_until_next_text"] = format_time_until_next(days, minutes)
-            else:
-                # Next collection is in the past (shouldn't happen, but handle it)
-                result["days_until_next"] = 0
-                result["minutes_until_next"] = 0
-                result["time_until_next_text"] = "Collection time has passed"
-    
+    if next_dt:
+        if next_dt >= now:
+            # Next collection is in the future
+            delta = next_dt - now
+            total_seconds = int(delta.total_seconds())
+            result["days_until_next"] = delta.days
+            result["minutes_until_next"] = total_seconds // 60
+            # Add plain text representation
+            result["time_until_next_text"] = format_time_until_next(total_seconds)
+        else:
+            # Next collection is in the past (shouldn't happen, but handle it)
+            result["days_until_next"] = 0
+            result["minutes_until_next"] = 0
+            result["time_until_next_text"] = "Collection time has passed"
+
     # Calculate time since last collection
-    if last_collection_str:
-        last_dt = parse_collection_date(last_collection_str)
-        if last_dt:
-            if last_dt <= now:
-                # Last collection is in the past
-                delta = now - last_dt
-                days = delta.days
-                minutes = int(delta.total_seconds() / 60)
-                result["days_since_last"] = days
-                result["minutes_since_last"] = minutes
-            else:
-                # Last collection is in the future (shouldn't happen, but handle it)
-                result["days_since_last"] = 0
-                result["minutes_since_last"] = 0
-    
+    if last_dt:
+        if last_dt <= now:
+            # Last collection is in the past
+            delta = now - last_dt
+            days = delta.days
+            minutes = int(delta.total_seconds() / 60)
+            result["days_since_last"] = days
+            result["minutes_since_last"] = minutes
+        else:
+            # Last collection is in the future (shouldn't happen, but handle it)
+            result["days_since_last"] = 0
+            result["minutes_since_last"] = 0
+
     return result
 
 
-def parse_collection_table(html):
-    """Parse the collection dates table from HTML."""
-    soup = BeautifulSoup(html, 'html.parser')
-    
+def calculate_time_differences(next_collection_str, last_collection_str, now=None, tz=_TZ):
+    """Calculate days and minutes since last collection and until next collection.
+
+    Args:
+        next_collection_str: Next collection date string
+        last_collection_str: Last collection date string
+        now: Current time to calculate against (defaults to datetime.now(tz);
+            callers doing this per row should compute it once and pass it in)
+        tz: Timezone used for parsing and the default now
+
+    Returns:
+        Dictionary with time difference calculations
+    """
+    if now is None:
+        now = datetime.now(tz)
+
+    return _calculate_diffs(
+        parse_collection_date(next_collection_str, tz=tz),
+        parse_collection_date(last_collection_str, tz=tz),
+        now,
+    )
+
+
+def parse_collection_table(html, include_diffs=False):
+    """Parse the collection dates table from HTML.
+
+    Args:
+        html: Page HTML containing the collection dates table
+        include_diffs: When True, attach the day/minute difference fields to
+            each row (only the debug JSON output reads them; the database
+            path stores raw dates and computes deltas in SQL)
+    """
+    # lxml is several times faster than html.parser, and the strainer skips
+    # everything outside the tables we actually read
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('table'))
+
     # Find the table with collection dates
     table = soup.find('table')
     if not table:
@@ -307,7 +401,10 @@ def parse_collection_table(html):
         return []
     
     collections = []
-    
+
+    # One clock read for the whole table - every row diffs against the same now
+    now = datetime.now(_TZ) if include_diffs else None
+
     for row in rows.find_all('tr'):
         # Check for row header (collection type)
         row_header = row.find('th')
@@ -376,33 +473,37 @@ def parse_collection_table(html):
                     item = {
                         "collection_type": individual_type,
                     }
-                    # Add waste group
-                    waste_group = get_waste_group(individual_type)
+                    # Classify once; store_collections reuses column_prefix
+                    column_prefix, waste_group = classify_bin(individual_type)
                     if waste_group:
                         item["waste_group"] = waste_group
+                    if column_prefix:
+                        item["column_prefix"] = column_prefix
                     if next_collection:
                         item["next_collection"] = next_collection
                     if last_collection:
                         item["last_collection"] = last_collection
                     # Calculate time differences for JSON output (not stored in DB)
-                    time_diffs = calculate_time_differences(next_collection, last_collection)
-                    item.update(time_diffs)
+                    if include_diffs:
+                        item.update(calculate_time_differences(next_collection, last_collection, now=now))
                     collections.append(item)
         else:
             # Single collection type
             if collection_type:
                 collection_item["collection_type"] = collection_type
-                # Add waste group
-                waste_group = get_waste_group(collection_type)
+                # Classify once; store_collections reuses column_prefix
+                column_prefix, waste_group = classify_bin(collection_type)
                 if waste_group:
                     collection_item["waste_group"] = waste_group
+                if column_prefix:
+                    collection_item["column_prefix"] = column_prefix
             if next_collection:
                 collection_item["next_collection"] = next_collection
             if last_collection:
                 collection_item["last_collection"] = last_collection
             # Calculate time differences for JSON output (not stored in DB)
-            time_diffs = calculate_time_differences(next_collection, last_collection)
-            collection_item.update(time_diffs)
+            if include_diffs:
+                collection_item.update(calculate_time_differences(next_collection, last_collection, now=now))
             if collection_item:
                 collections.append(collection_item)
     
@@ -411,40 +512,44 @@ def parse_collection_table(html):
 
 def get_bin_type_column_prefix(collection_type):
     """Get the column name prefix for a bin type.
-    
+
     Args:
         collection_type: The raw collection type string from the website
-    
+
     Returns:
         Column name prefix (e.g., "black_rubbish_140l") or None if not recognized
     """
-    if not collection_type:
-        return None
-    
-    collection_type_lower = collection_type.lower()
-    
-    # Black Rubbish (140L)
-    if "black" in collection_type_lower and "rubbish" in collection_type_lower:
-        return "black_rubbish_140l"
-    
-    # Blue Cardboard Bag
-    if "blue" in collection_type_lower and ("cardboard" in collection_type_lower or "bag" in collection_type_lower):
-        return "blue_cardboard_bag"
-    
-    # Food Waste Bin
-    if "food" in collection_type_lower or "caddy" in collection_type_lower:
-        return "black_food_waste"
-    
-    # Garden Waste (240L)
-    if "garden" in collection_type_lower and "waste" in collection_type_lower:
-        return "green_garden_bin"
-    
-    # Green Recycling Box
-    if "green" in collection_type_lower and "recycling" in collection_type_lower:
-        return "green_recycling_box"
-    
-    # If not recognized, return None (will be skipped)
-    return None
+    return classify_bin(collection_type)[0]
+
+
+# Shared connection pool, created lazily when PG_POOL_MIN is set
+_pool = None
+
+
+def get_db_connection():
+    """Open a database connection.
+
+    Uses a shared ThreadedConnectionPool when PG_POOL_MIN is set (worthwhile
+    when the script is embedded in a longer-lived process); one-shot cron
+    runs keep the plain connect.
+    """
+    global _pool
+    pool_min = os.getenv("PG_POOL_MIN", "").strip()
+    if pool_min:
+        if _pool is None:
+            _pool = psycopg2.pool.ThreadedConnectionPool(
+                int(pool_min), int(os.getenv("PG_POOL_MAX", "4")), **DB_CONFIG
+            )
+        return _pool.getconn()
+    return psycopg2.connect(**DB_CONFIG)
+
+
+def release_db_connection(conn):
+    """Return a pooled connection to the pool, or close a plain one."""
+    if _pool is not None:
+        _pool.putconn(conn)
+    else:
+        conn.close()
 
 
 def drop_tables(conn):
@@ -477,13 +582,26 @@ def drop_tables(conn):
 
 
 def create_tables(conn):
-    """Create simplified database table with columns for each bin type."""
+    """Create simplified database table with columns for each bin type.
+
+    Skips all DDL when the schema is already in place, so routine runs cost
+    one lightweight catalog lookup instead of a round of CREATE statements.
+    """
     cursor = conn.cursor()
-    
+
+    # to_regclass returns NULL when the table doesn't exist yet
+    cursor.execute("SELECT to_regclass('collections')")
+    if cursor.fetchone()[0] is not None:
+        # Schema is in place; just warm the per-connection prepared upsert
+        _ensure_upsert_prepared(cursor)
+        conn.commit()
+        cursor.close()
+        return
+
     # Create collections table with one row per address
     # Each bin type has its own last_collection and next_collection columns
     cursor.execute("""
-        CREATE TABLE collections (
+        CREATE TABLE IF NOT EXISTS collections (
             address TEXT PRIMARY KEY,
             black_rubbish_140l_last_collection TIMESTAMP WITH TIME ZONE,
             black_rubbish_140l_next_collection TIMESTAMP WITH TIME ZONE,
@@ -501,7 +619,7 @@ def create_tables(conn):
     
     # Create index for site_last_checked
     cursor.execute("""
-        CREATE INDEX idx_collections_site_last_checked ON collections(site_last_checked)
+        CREATE INDEX IF NOT EXISTS idx_collections_site_last_checked ON collections(site_last_checked)
     """)
     
     # Create function to format time delta as human-readable string
@@ -600,6 +718,9 @@ def create_tables(conn):
         FROM collections;
     """)
     
+    # Prepare the upsert alongside the schema so storage calls can use it
+    _ensure_upsert_prepared(cursor)
+
     conn.commit()
     cursor.close()
     print("✓ Created database tables, function, and view", flush=True)
@@ -607,26 +728,86 @@ def create_tables(conn):
 
 
 
-def store_collections(conn, address, postcode, collections_data):
-    """Store collection data in the simplified database schema with columns for each bin type."""
-    try:
-        tz = ZoneInfo(TIMEZONE)
-    except Exception:
-        tz = ZoneInfo("Europe/London")
-    site_last_checked = datetime.now(tz)
-    
+# Upsert on the address primary key so repeat runs refresh existing rows
+_UPSERT_UPDATE_ASSIGNMENTS = ", ".join(
+    f"{col} = EXCLUDED.{col}" for col in COLLECTION_COLUMNS[1:]
+)
+
+
+def _ensure_upsert_prepared(cursor):
+    """PREPARE the single-row upsert on this connection if needed.
+
+    PREPARE is per-connection server state: once it exists the server
+    reuses the cached parse/plan and the client stops building SQL strings.
+    """
+    cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = 'upsert_collection'")
+    if cursor.fetchone() is not None:
+        return
+
+    placeholders = ", ".join(f"${i}" for i in range(1, len(COLLECTION_COLUMNS) + 1))
+    cursor.execute(f"""
+        PREPARE upsert_collection AS
+        INSERT INTO collections ({', '.join(COLLECTION_COLUMNS)})
+        VALUES ({placeholders})
+        ON CONFLICT (address) DO UPDATE SET {_UPSERT_UPDATE_ASSIGNMENTS}
+    """)
+
+
+def store_collections_bulk(conn, rows):
+    """Upsert a batch of collection rows in a single statement.
+
+    A lone row goes through the prepared upsert_collection statement;
+    larger batches are staged through psycopg2's execute_values so many
+    addresses can be ingested without per-row round trips.
+
+    Args:
+        conn: Database connection
+        rows: List of tuples in COLLECTION_COLUMNS order, i.e.
+            (address, site_last_checked, *bin type columns)
+    """
+    if not rows:
+        return
+
     cursor = conn.cursor()
-    
+
+    if len(rows) == 1:
+        _ensure_upsert_prepared(cursor)
+        params = ", ".join(["%s"] * len(COLLECTION_COLUMNS))
+        cursor.execute(f"EXECUTE upsert_collection ({params})", rows[0])
+    else:
+        sql = f"""
+            INSERT INTO collections ({', '.join(COLLECTION_COLUMNS)})
+            VALUES %s
+            ON CONFLICT (address) DO UPDATE SET {_UPSERT_UPDATE_ASSIGNMENTS}
+        """
+        psycopg2.extras.execute_values(cursor, sql, rows, page_size=1000)
+
+    conn.commit()
+    cursor.close()
+
+
+def build_collection_row(address, collections_data, site_last_checked):
+    """Build one COLLECTION_COLUMNS-ordered row tuple for an address.
+
+    Args:
+        address: Address line the collections belong to
+        collections_data: Parsed rows from parse_collection_table
+        site_last_checked: Timestamp of this scrape
+
+    Returns:
+        Tuple ready for store_collections_bulk
+    """
     # Build update dictionary for all bin types
     update_fields = {}
-    
+
     for collection in collections_data:
         collection_type_name = collection.get("collection_type")
         if not collection_type_name:
             continue
         
-        # Get column prefix for this bin type
-        column_prefix = get_bin_type_column_prefix(collection_type_name)
+        # Use the prefix attached by parse_collection_table, classifying only
+        # if the row came from elsewhere
+        column_prefix = collection.get("column_prefix") or get_bin_type_column_prefix(collection_type_name)
         if not column_prefix:
             # Skip unrecognized bin types
             continue
@@ -651,246 +832,458 @@ def store_collections(conn, address, postcode, collections_data):
         update_fields[f"{column_prefix}_last_collection"] = last_collection_dt
         update_fields[f"{column_prefix}_next_collection"] = next_collection_dt
     
-    # Build SQL for INSERT (table is wiped each run, so no conflicts)
-    # Start with address and site_last_checked
-    columns = ["address", "site_last_checked"]
-    values = [address, site_last_checked]
-    placeholders = ["%s", "%s"]
-    
-    # Add all bin type columns
-    for column_prefix in ["black_rubbish_140l", "blue_cardboard_bag", "black_food_waste", 
-                          "green_garden_bin", "green_recycling_box"]:
-        last_col = f"{column_prefix}_last_collection"
-        next_col = f"{column_prefix}_next_collection"
-        
-        columns.append(last_col)
-        columns.append(next_col)
-        
-        # Use value from update_fields if available, otherwise None
-        values.append(update_fields.get(last_col))
-        values.append(update_fields.get(next_col))
-        
-        placeholders.append("%s")
-        placeholders.append("%s")
-    
-    # Build and execute SQL
-    sql = f"""
-        INSERT INTO collections ({', '.join(columns)})
-        VALUES ({', '.join(placeholders)})
+    # Build the row tuple in COLLECTION_COLUMNS order
+    row = [address, site_last_checked]
+    for column_prefix in BIN_COLUMN_PREFIXES:
+        row.append(update_fields.get(f"{column_prefix}_last_collection"))
+        row.append(update_fields.get(f"{column_prefix}_next_collection"))
+
+    return tuple(row)
+
+
+def store_collections(conn, address, postcode, collections_data):
+    """Store collection data in the simplified database schema with columns for each bin type."""
+    row = build_collection_row(address, collections_data, datetime.now(_TZ))
+    store_collections_bulk(conn, [row])
+
+    stored = sum(1 for value in row[2:] if value is not None)
+    print(f"✓ Stored collection data for {stored} bin type columns in database")
+
+
+def _find_form_fields(form):
+    """Collect the hidden input name/value pairs from a form."""
+    return {
+        inp.get("name"): inp.get("value", "")
+        for inp in form.find_all("input", {"type": "hidden"})
+        if inp.get("name")
+    }
+
+
+def fetch_collections_html_http(postcode, address_text):
+    """Fetch the collection dates page by replaying the site's form posts.
+
+    Drives the postcode -> address -> collection days flow with plain HTTP
+    requests instead of a browser: GET the form to pick up cookies and hidden
+    inputs, POST the postcode to get the address list, then POST the chosen
+    address to get the results HTML. Raises on any unexpected response so the
+    caller can fall back to the Playwright path.
+
+    Args:
+        postcode: Postcode to look up
+        address_text: Address line to match in the address dropdown
+
+    Returns:
+        HTML of the results page containing the collection dates table
     """
-    
-    cursor.execute(sql, values)
-    
-    conn.commit()
-    cursor.close()
-    print(f"✓ Stored collection data for {len([k for k in update_fields.keys() if k.endswith('_last_collection')])} bin types in database")
+    if httpx is None:
+        raise RuntimeError("httpx is not installed")
 
+    headers = {
+        "User-Agent": (
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
+        ),
+    }
 
-def main():
-    """Main function to fetch and parse collection dates."""
-    print(f"Starting bin collection scraper...", flush=True)
-    print(f"  Postcode: {POSTCODE}", flush=True)
-    print(f"  Address: {ADDRESS_TEXT}", flush=True)
-    print(f"  Timezone: {TIMEZONE}", flush=True)
-    print(f"  Database: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}", flush=True)
-    print()
-    
-    with sync_playwright() as p:
-        # Launch headless browser
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-        
+    with httpx.Client(headers=headers, timeout=30.0, follow_redirects=True) as client:
+        # Step 1: GET the form to pick up session cookies and hidden inputs
+        response = client.get(URL)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+        form = soup.find('form')
+        if not form:
+            raise RuntimeError("no form found on collection day page")
+
+        action = urljoin(URL, form.get('action') or URL)
+        fields = _find_form_fields(form)
+
+        # Find the postcode input (not the header search)
+        postcode_field = None
+        for inp in form.find_all('input', {'type': 'text'}):
+            name = (inp.get('name') or inp.get('id') or '')
+            if 'postcode' in name.lower():
+                postcode_field = inp.get('name') or inp.get('id')
+                break
+        if not postcode_field:
+            raise RuntimeError("could not locate postcode input in form")
+
+        # Step 2: POST the postcode to get the address list
+        response = client.post(action, data={**fields, postcode_field: postcode})
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+        select = soup.find('select')
+        if not select:
+            raise RuntimeError("no address dropdown in postcode response")
+
+        # Step 3: find the matching address option (exact, then partial)
+        option_value = None
+        for option in select.find_all('option'):
+            if option.get_text(strip=True) == address_text:
+                option_value = option.get('value')
+                break
+        if not option_value:
+            for option in select.find_all('option'):
+                option_text = option.get_text(strip=True).lower()
+                if option_text and (address_text.lower() in option_text or option_text in address_text.lower()):
+                    option_value = option.get('value')
+                    break
+        if not option_value:
+            raise RuntimeError(f"could not find address '{address_text}' in dropdown")
+
+        # Step 4: POST the chosen address to get the results HTML
+        form = soup.find('form') or form
+        action = urljoin(URL, form.get('action') or URL)
+        fields = _find_form_fields(form)
+        select_name = select.get('name') or select.get('id') or 'address'
+
+        response = client.post(action, data={**fields, select_name: option_value})
+        response.raise_for_status()
+
+        if '<table' not in response.text:
+            raise RuntimeError("no results table in collection days response")
+
+        return response.text
+
+
+async def fetch_collections_html_browser(browser, postcode, address_text):
+    """Fetch the collection dates page with a shared Playwright browser.
+
+    Args:
+        browser: Connected async Playwright browser (shared across addresses;
+            each call gets its own isolated context)
+        postcode: Postcode to look up
+        address_text: Address line to match in the address dropdown
+
+    Returns:
+        HTML of the results page containing the collection dates table
+    """
+    context = await browser.new_context()
+
+    # Block heavy resources the scraper never reads (images, webfonts,
+    # media, stylesheets) - we only need the form and the results table
+    async def _block_unneeded(route):
+        if route.request.resource_type in ("image", "font", "media", "stylesheet"):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _block_unneeded)
+
+    page = await context.new_page()
+
+    try:
+        # Navigate to the page (explicit selector waits below handle the
+        # dynamic parts, so we don't need to wait for network idle)
+        await page.goto(URL, wait_until="domcontentloaded")
+
+        # Find and fill the postcode input (not the header search). Resolve
+        # via the stable ids/names first - the old multi-branch XPath union
+        # re-scans the DOM per alternative, so it only remains as a fallback
+        postcode_input = page.locator(
+            "#PCFinderPostcode, input[name='postcode'], input[id*='postcode' i]"
+        ).first
         try:
-            # Navigate to the page
-            page.goto(URL, wait_until="networkidle")
-            
-            # Find and fill the postcode input (not the header search)
+            await postcode_input.wait_for(state="visible", timeout=3000)
+        except Exception:
             postcode_input = page.locator(
                 "xpath=//label[contains(text(), 'Enter a postcode') or contains(text(), 'postcode')]/following::input[@type='text'] | "
                 "//label[contains(text(), 'Enter a postcode') or contains(text(), 'postcode')]/../input[@type='text'] | "
                 "//form//input[@type='text' and (contains(@name, 'postcode') or contains(@id, 'postcode'))] | "
                 "//*[contains(@class, 'form') or contains(@id, 'form')]//input[@type='text'][not(contains(@class, 'search') or contains(@id, 'search'))]"
             ).first
-            
-            # Clear and enter postcode
-            postcode_input.click()
-            postcode_input.fill("")
-            postcode_input.type(POSTCODE, delay=50)
-            random_wait()
-            
-            # Verify postcode was entered
-            entered_value = postcode_input.input_value()
-            if entered_value != POSTCODE:
-                postcode_input.fill("")
-                postcode_input.type(POSTCODE, delay=50)
-                random_wait()
-            
-            # Click the Find button
+
+        # Clear and enter postcode (keep the typing delay as the one
+        # humanizing touch - everything else waits on real DOM state)
+        await postcode_input.click()
+        await postcode_input.fill("")
+        await postcode_input.type(postcode, delay=50)
+
+        # Verify postcode was entered
+        entered_value = await postcode_input.input_value()
+        if entered_value != postcode:
+            await postcode_input.fill("")
+            await postcode_input.type(postcode, delay=50)
+
+        # Click the Find button - same CSS/role-first, XPath-fallback approach
+        find_button = page.get_by_role("button", name="Find").first
+        try:
+            await find_button.wait_for(state="visible", timeout=3000)
+        except Exception:
             find_button = page.locator(
                 "xpath=//button[contains(., 'Find') or contains(text(), 'Find')] | //input[@type='submit' and contains(@value, 'Find')] | //button[@type='submit']"
             ).first
-            
-            find_button.click()
-            
-            # Wait for address dropdown to appear and populate
-            print("Waiting for address dropdown to load...", flush=True)
-            # First wait for the select element to be attached to the DOM
-            # Try specific ID first, then fall back to generic select
-            try:
-                page.wait_for_selector("#PCSelectp1", state="attached", timeout=10000)
-                select_locator = page.locator("#PCSelectp1")
-            except Exception:
-                page.wait_for_selector("select", state="attached", timeout=10000)
-                select_locator = page.locator("select").first
-            
-            # Wait for the select to become visible (it might be hidden initially)
-            try:
-                select_locator.wait_for(state="visible", timeout=10000)
-            except Exception:
-                # If it doesn't become visible, try to interact with it anyway
-                print("Warning: Select element found but not visible, attempting to interact anyway...", flush=True)
-            
-            random_wait()  # Wait for options to populate
-            
-            # Wait for options to populate
-            def options_populated():
-                options = select_locator.locator("option").all()
-                return len(options) > 1
-            
-            # Wait up to 10 seconds for options
-            for _ in range(20):
-                if options_populated():
-                    break
-                random_wait()
-            
-            random_wait()
-            
-            # Select the address
-            select = select_locator
-            try:
-                select.select_option(label=ADDRESS_TEXT)
-            except Exception as e:
-                # If normal selection fails (e.g., element is hidden), try JavaScript
-                print(f"Warning: Normal select_option failed, trying JavaScript fallback...", flush=True)
-                # Get all option labels and values using JavaScript (works even if hidden)
-                options_data = page.evaluate("""
-                    () => {
-                        var select = document.querySelector('#PCSelectp1') || document.querySelector('select');
-                        if (!select) return [];
-                        var options = [];
-                        for (var i = 0; i < select.options.length; i++) {
-                            var opt = select.options[i];
-                            if (opt.value && opt.text) {
-                                options.push({value: opt.value, text: opt.text.trim()});
-                            }
+
+        await find_button.click()
+
+        # Wait for address dropdown to appear and populate
+        print("Waiting for address dropdown to load...", flush=True)
+        # First wait for the select element to be attached to the DOM
+        # Try specific ID first, then fall back to generic select
+        try:
+            await page.wait_for_selector("#PCSelectp1", state="attached", timeout=10000)
+            select_locator = page.locator("#PCSelectp1")
+        except Exception:
+            await page.wait_for_selector("select", state="attached", timeout=10000)
+            select_locator = page.locator("select").first
+
+        # Wait for the select to become visible (it might be hidden initially)
+        try:
+            await select_locator.wait_for(state="visible", timeout=10000)
+        except Exception:
+            # If it doesn't become visible, try to interact with it anyway
+            print("Warning: Select element found but not visible, attempting to interact anyway...", flush=True)
+
+        # Wait for the address lookup to populate the dropdown - the
+        # second option appearing means real addresses have arrived
+        await select_locator.locator("option:nth-child(2)").wait_for(
+            state="attached", timeout=10000
+        )
+
+        # Select the address
+        select = select_locator
+        try:
+            await select.select_option(label=address_text)
+        except Exception:
+            # If normal selection fails (e.g., element is hidden), try JavaScript
+            print(f"Warning: Normal select_option failed, trying JavaScript fallback...", flush=True)
+            # Get all option labels and values using JavaScript (works even if hidden)
+            options_data = await page.evaluate("""
+                () => {
+                    var select = document.querySelector('#PCSelectp1') || document.querySelector('select');
+                    if (!select) return [];
+                    var options = [];
+                    for (var i = 0; i < select.options.length; i++) {
+                        var opt = select.options[i];
+                        if (opt.value && opt.text) {
+                            options.push({value: opt.value, text: opt.text.trim()});
                         }
-                        return options;
                     }
-                """)
-                
-                if not options_data:
-                    raise Exception("Could not retrieve options from dropdown")
-                
-                # Debug: print available options
-                print(f"Available options in dropdown ({len(options_data)}):", flush=True)
-                for opt in options_data[:5]:  # Show first 5
-                    print(f"  - '{opt['text']}' (value: {opt['value']})", flush=True)
-                if len(options_data) > 5:
-                    print(f"  ... and {len(options_data) - 5} more", flush=True)
-                
-                # Try to find exact match
-                option_value = None
+                    return options;
+                }
+            """)
+
+            if not options_data:
+                raise Exception("Could not retrieve options from dropdown")
+
+            # Debug: print available options
+            print(f"Available options in dropdown ({len(options_data)}):", flush=True)
+            for opt in options_data[:5]:  # Show first 5
+                print(f"  - '{opt['text']}' (value: {opt['value']})", flush=True)
+            if len(options_data) > 5:
+                print(f"  ... and {len(options_data) - 5} more", flush=True)
+
+            # Try to find exact match
+            option_value = None
+            for opt in options_data:
+                if opt['text'] == address_text:
+                    option_value = opt['value']
+                    break
+
+            # If no exact match, try partial match
+            if not option_value:
                 for opt in options_data:
-                    if opt['text'] == ADDRESS_TEXT:
+                    opt_text = opt['text'].lower()
+                    addr_text = address_text.lower()
+                    if addr_text in opt_text or opt_text in addr_text:
                         option_value = opt['value']
+                        print(f"Found partial match: '{opt['text']}'", flush=True)
                         break
-                
-                # If no exact match, try partial match
-                if not option_value:
-                    for opt in options_data:
-                        opt_text = opt['text'].lower()
-                        addr_text = ADDRESS_TEXT.lower()
-                        if addr_text in opt_text or opt_text in addr_text:
-                            option_value = opt['value']
-                            print(f"Found partial match: '{opt['text']}'", flush=True)
-                            break
-                
-                if option_value:
-                    # Use JavaScript to set the value
-                    result = page.evaluate("""
-                        (value) => {
-                            var select = document.querySelector('#PCSelectp1') || document.querySelector('select');
-                            if (select) {
-                                select.value = value;
-                                select.dispatchEvent(new Event('change', { bubbles: true }));
-                                return select.value === value;
-                            }
-                            return false;
+
+            if option_value:
+                # Use JavaScript to set the value
+                result = await page.evaluate("""
+                    (value) => {
+                        var select = document.querySelector('#PCSelectp1') || document.querySelector('select');
+                        if (select) {
+                            select.value = value;
+                            select.dispatchEvent(new Event('change', { bubbles: true }));
+                            return select.value === value;
                         }
-                    """, option_value)
-                    if not result:
-                        raise Exception(f"Failed to set select value to '{option_value}'")
-                    print(f"Successfully selected address using JavaScript", flush=True)
-                else:
-                    # Print all available options for debugging
-                    all_options = [opt['text'] for opt in options_data]
-                    raise Exception(f"Could not find address '{ADDRESS_TEXT}' in dropdown. Available options: {all_options[:10]}")
-            
-            # Wait after address selection
-            print("Waiting after address selection...", flush=True)
-            random_wait()
-            
-            # Wait for and click "Find collection days" button
-            print("Waiting for 'Find collection days' button...", flush=True)
-            next_button = page.locator("#nextBtn")
-            next_button.wait_for(state="visible", timeout=10000)
-            next_button.click()
-            
-            # Wait for results table
-            print("Waiting for collection dates to load...", flush=True)
-            random_wait()
-            
-            page.wait_for_selector("table", state="visible", timeout=20000)
-            
-            # Get the page HTML and parse with BeautifulSoup
-            html = page.content()
-            collections = parse_collection_table(html)
-            
-            # Connect to database and store data
-            print("Connecting to database...", flush=True)
-            db_conn = psycopg2.connect(**DB_CONFIG)
+                        return false;
+                    }
+                """, option_value)
+                if not result:
+                    raise Exception(f"Failed to set select value to '{option_value}'")
+                print(f"Successfully selected address using JavaScript", flush=True)
+            else:
+                # Print all available options for debugging
+                all_options = [opt['text'] for opt in options_data]
+                raise Exception(f"Could not find address '{address_text}' in dropdown. Available options: {all_options[:10]}")
+
+        # Wait for and click "Find collection days" button
+        print("Waiting for 'Find collection days' button...", flush=True)
+        next_button = page.locator("#nextBtn")
+        await next_button.wait_for(state="visible", timeout=10000)
+        await next_button.click()
+
+        # Wait for results table
+        print("Waiting for collection dates to load...", flush=True)
+        await page.wait_for_selector("table", state="visible", timeout=20000)
+
+        # Return the page HTML for parsing
+        return await page.content()
+
+    finally:
+        # Only tear down our context - the browser is shared with the other
+        # in-flight addresses (and stays warm when it's a remote server)
+        await context.close()
+
+
+async def run_scrapes(addresses, use_browser=False):
+    """Scrape every address concurrently and return the fetched HTML.
+
+    Runs the HTTP fast path for all addresses first (in worker threads), then
+    retries any failures through one shared Playwright browser. Concurrency
+    is capped by SCRAPE_CONCURRENCY (default 4) so we don't hammer the site
+    or pile up browser contexts.
+
+    Args:
+        addresses: List of (postcode, address_text) pairs
+        use_browser: Force the Playwright path for every address
+
+    Returns:
+        List of (postcode, address_text, html-or-exception) tuples in the
+        same order as addresses
+    """
+    semaphore = asyncio.Semaphore(int(os.getenv("SCRAPE_CONCURRENCY", "4")))
+    results = {}
+
+    if use_browser:
+        browser_targets = list(addresses)
+    else:
+        print("Fetching collection dates over HTTP...", flush=True)
+
+        async def _http_one(pc, ad):
+            async with semaphore:
+                return await asyncio.to_thread(fetch_collections_html_http, pc, ad)
+
+        gathered = await asyncio.gather(
+            *[_http_one(pc, ad) for pc, ad in addresses], return_exceptions=True
+        )
+
+        browser_targets = []
+        for (pc, ad), outcome in zip(addresses, gathered):
+            if isinstance(outcome, BaseException):
+                print(f"Warning: HTTP fetch failed for {ad} ({outcome}), falling back to browser...",
+                      file=sys.stderr, flush=True)
+                browser_targets.append((pc, ad))
+            else:
+                results[ad] = outcome
+
+    if browser_targets:
+        async with async_playwright() as p:
+            # Connect to a long-lived browser server if one is available
+            # (see bin_browser_daemon.py), otherwise pay the launch cost locally
+            ws_endpoint = os.getenv("PLAYWRIGHT_WS", "").strip()
+            if ws_endpoint:
+                print(f"Connecting to browser server at {ws_endpoint}...", flush=True)
+                browser = await p.chromium.connect(ws_endpoint)
+            else:
+                browser = await p.chromium.launch(headless=True)
+
             try:
-                # Wipe existing tables and recreate schema
-                print("Wiping and recreating database schema...", flush=True)
-                drop_tables(db_conn)
-                create_tables(db_conn)
-                print("✓ Database schema ready", flush=True)
-                
-                # Store collections in database
-                store_collections(db_conn, ADDRESS_TEXT, POSTCODE, collections)
-                
+                async def _browser_one(pc, ad):
+                    async with semaphore:
+                        return await fetch_collections_html_browser(browser, pc, ad)
+
+                gathered = await asyncio.gather(
+                    *[_browser_one(pc, ad) for pc, ad in browser_targets],
+                    return_exceptions=True,
+                )
             finally:
-                db_conn.close()
-            
-            # Output summary
-            print(f"\n✓ Successfully processed {len(collections)} collection types for {ADDRESS_TEXT}")
-            print(f"✓ Data stored in database: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
-            
-            # Output as JSON for verification (can be disabled for production)
-            if os.getenv("DEBUG", "false").lower() == "true":
-                output = {
-                    "address": ADDRESS_TEXT,
-                    "postcode": POSTCODE,
-                    "timezone": TIMEZONE,
-                    "collections": collections
-                }
-                print("\n" + json.dumps(output, indent=2))
-            
-        finally:
-            browser.close()
+                if not ws_endpoint:
+                    await browser.close()
+
+        for (pc, ad), outcome in zip(browser_targets, gathered):
+            results[ad] = outcome
+
+    return [(pc, ad, results[ad]) for pc, ad in addresses]
+
+
+def main():
+    """Main function to fetch and parse collection dates."""
+    parser = argparse.ArgumentParser(description="Fetch bin collection dates and store them in PostgreSQL.")
+    parser.add_argument(
+        "--browser",
+        action="store_true",
+        help="force the Playwright browser path instead of the HTTP fast path",
+    )
+    args = parser.parse_args()
+
+    print(f"Starting bin collection scraper...", flush=True)
+    for pc, ad in ADDRESSES:
+        print(f"  Address: {ad} ({pc})", flush=True)
+    print(f"  Timezone: {TIMEZONE}", flush=True)
+    print(f"  Database: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}", flush=True)
+    print()
+
+    results = asyncio.run(run_scrapes(ADDRESSES, use_browser=args.browser))
+
+    # Parse every successful fetch and build one bulk upsert batch
+    site_last_checked = datetime.now(_TZ)
+    rows = []
+    parsed = []
+    failures = []
+    for pc, ad, outcome in results:
+        if isinstance(outcome, BaseException):
+            failures.append((ad, outcome))
+            continue
+        collections = parse_collection_table(outcome, include_diffs=DEBUG)
+        parsed.append((pc, ad, collections))
+        rows.append(build_collection_row(ad, collections, site_last_checked))
+
+    for ad, error in failures:
+        print(f"Error: failed to fetch collections for {ad}: {error}", file=sys.stderr, flush=True)
+
+    # Connect to database and store data
+    print("Connecting to database...", flush=True)
+    db_conn = get_db_connection()
+    try:
+        # Recreate the schema from scratch only on request - the upsert keeps
+        # existing rows fresh, so routine runs skip the DDL round trips
+        if os.getenv("RESET_SCHEMA", "false").lower() == "true":
+            print("Wiping and recreating database schema...", flush=True)
+            drop_tables(db_conn)
+        create_tables(db_conn)
+        print("✓ Database schema ready", flush=True)
+
+        # Store all addresses in a single batch
+        store_collections_bulk(db_conn, rows)
+
+    finally:
+        release_db_connection(db_conn)
+
+    # Output summary
+    print()
+    for pc, ad, collections in parsed:
+        print(f"✓ Successfully processed {len(collections)} collection types for {ad}")
+    if rows:
+        print(f"✓ Data stored in database: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
+
+    # Output as JSON for verification (debug only - production runs never
+    # build or serialize this structure)
+    if DEBUG:
+        output = {
+            "timezone": TIMEZONE,
+            "results": [
+                {"address": ad, "postcode": pc, "collections": collections}
+                for pc, ad, collections in parsed
+            ],
+        }
+        if orjson is not None:
+            # orjson serializes straight to bytes, skipping the stdlib encoder
+            print(flush=True)
+            sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
+        else:
+            print("\n" + json.dumps(output, indent=2))
+
+    if failures and not parsed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
     main()
-